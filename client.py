@@ -1,27 +1,47 @@
 import os
 import asyncio
 import aiohttp
-import aiofiles
 import platform
 import json
+import msgpack
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from itertools import repeat
 from random import randint
-from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-import base64
 import colorama
+import pygit2
 from colorama import Fore, Style, Back
 from typing import Dict, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from pathlib import Path
 import logging
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.logging import RichHandler
 from rich.table import Table
 from rich.panel import Panel
+from tqdm import tqdm
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+from hwid_util import compute_hwid
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pybase64 as base64  # SIMD base64, drop-in stdlib API
+except ImportError:
+    import base64
 
 # Initialize colorama and rich console
 colorama.init()
@@ -35,7 +55,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger("hwid_client")
 
-@dataclass
+def _build_day_trees(repo_path: str, days: list) -> bytes:
+    """Worker: write blob/tree objects for a shard of days.
+
+    Object writes are content-addressed and atomic in libgit2, so shards can
+    write to the same object database concurrently. Each day is a tuple of
+    (starting commit counter, commit count, formatted date); the return value
+    is the concatenated 20-byte raw tree OIDs in commit order.
+    """
+    repo = pygit2.Repository(repo_path)
+    oids = []
+    for ctr_start, count, formatted_date in days:
+        for i in range(count):
+            line = f"commit #{ctr_start + i}: {formatted_date}\n"
+            blob_id = repo.create_blob(line.encode())
+            tree_builder = repo.TreeBuilder()
+            tree_builder.insert("commit.txt", blob_id, pygit2.GIT_FILEMODE_BLOB)
+            oids.append(tree_builder.write().raw)
+    return b"".join(oids)
+
+@dataclass(slots=True)
 class Settings:
     total_day: int = 36600
     commit_freq: int = 100
@@ -54,7 +93,9 @@ class HWIDClient:
         self.MAX_RETRIES = 3
         self.RETRY_DELAY = 2
         self.session: Optional[aiohttp.ClientSession] = None
-        
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._hwid: Optional[str] = None
+
         # Initialize encryption and settings
         try:
             self.cipher_suite = self.init_encryption()
@@ -63,29 +104,47 @@ class HWIDClient:
             logger.error(f"Initialization Error: {e}")
             raise
 
-    def init_encryption(self) -> Fernet:
-        """Initialize encryption with PBKDF2 key derivation"""
+    def init_encryption(self) -> AESGCM:
+        """Initialize AES-GCM encryption with a derived, cached key"""
         try:
             if not self.ENCRYPTION_KEY_FILE.exists():
-                # Generate a strong key using PBKDF2
-                salt = os.urandom(16)
-                kdf = PBKDF2HMAC(
-                    algorithm=hashes.SHA256(),
-                    length=32,
-                    salt=salt,
-                    iterations=100000,
-                )
-                key = base64.urlsafe_b64encode(kdf.derive(os.urandom(32)))
-                
+                # One getrandom call covers both the salt and the key material
+                entropy = os.urandom(48)
+                salt, secret = entropy[:16], entropy[16:]
+                if os.environ.get("HWID_FAST_KDF"):
+                    # The input is 32 bytes of OS entropy, not a password, so
+                    # PBKDF2's iteration stretching buys nothing here: a
+                    # single-shot HKDF gives the same security in one hash
+                    kdf = HKDF(
+                        algorithm=hashes.SHA256(),
+                        length=32,
+                        salt=salt,
+                        info=b"hwid-fernet",
+                    )
+                else:
+                    # Generate a strong key using PBKDF2
+                    kdf = PBKDF2HMAC(
+                        algorithm=hashes.SHA256(),
+                        length=32,
+                        salt=salt,
+                        iterations=100000,
+                    )
+                key = base64.urlsafe_b64encode(kdf.derive(secret))
+
                 # Save the key
                 self.ENCRYPTION_KEY_FILE.write_bytes(key)
             else:
                 key = self.ENCRYPTION_KEY_FILE.read_bytes()
-                
-            return Fernet(key)
+
+            # The key file stores the 32-byte key base64-encoded
+            return AESGCM(base64.urlsafe_b64decode(key))
         except Exception as e:
             raise Exception(f"Failed to initialize encryption: {e}")
 
+    def _settings_dict(self) -> Dict[str, Any]:
+        """Snapshot the settings fields (Settings is slotted, so no __dict__)"""
+        return {f.name: getattr(self.settings, f.name) for f in fields(Settings)}
+
     def save_settings(self) -> None:
         """Save encrypted settings with backup"""
         backup_path = None
@@ -95,10 +154,11 @@ class HWIDClient:
                 backup_path = self.SETTINGS_FILE.with_suffix('.bak')
                 self.SETTINGS_FILE.rename(backup_path)
 
-            # Save new settings
-            settings_data = json.dumps(asdict(self.settings))
-            encrypted_data = self.cipher_suite.encrypt(settings_data.encode())
-            self.SETTINGS_FILE.write_bytes(encrypted_data)
+            # Save new settings as nonce || ciphertext || tag
+            settings_data = msgpack.packb(self._settings_dict(), use_bin_type=True)
+            nonce = os.urandom(12)
+            encrypted_data = self.cipher_suite.encrypt(nonce, settings_data, None)
+            self.SETTINGS_FILE.write_bytes(nonce + encrypted_data)
 
             # Remove backup if save was successful
             if backup_path and backup_path.exists():
@@ -116,150 +176,223 @@ class HWIDClient:
         if self.SETTINGS_FILE.exists():
             try:
                 encrypted_data = self.SETTINGS_FILE.read_bytes()
-                decrypted_data = self.cipher_suite.decrypt(encrypted_data).decode()
-                settings_dict = json.loads(decrypted_data)
-                
-                # Validate settings
-                for key, value in settings_dict.items():
-                    if hasattr(self.settings, key):
-                        setattr(self.settings, key, value)
-                    else:
-                        logger.warning(f"Unknown setting '{key}' found in settings file")
-                        
+                nonce, ciphertext = encrypted_data[:12], encrypted_data[12:]
+                decrypted_data = self.cipher_suite.decrypt(nonce, ciphertext, None)
+                settings_dict = msgpack.unpackb(decrypted_data, raw=False)
+
+                # Validate settings and rebuild the dataclass in one call
+                valid = {f.name for f in fields(Settings)}
+                for key in settings_dict.keys() - valid:
+                    logger.warning(f"Unknown setting '{key}' found in settings file")
+                self.settings = Settings(
+                    **{k: settings_dict[k] for k in settings_dict.keys() & valid}
+                )
+
+
             except Exception as e:
                 logger.warning(f"Could not load settings: {e}")
 
+    async def start(self) -> None:
+        """Create the shared HTTP session with a tuned connection pool"""
+        self._connector = aiohttp.TCPConnector(
+            limit=10,
+            limit_per_host=4,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+        self.session = aiohttp.ClientSession(
+            connector=self._connector,
+            timeout=aiohttp.ClientTimeout(total=10),
+            headers={
+                'Content-Type': 'application/json',
+                'User-Agent': f'HWIDClient/{platform.system()}'
+            }
+        )
+
+    async def __aenter__(self) -> "HWIDClient":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self.session:
+            await self.session.close()
+            self.session = None
+
     async def get_hwid(self) -> Optional[str]:
-        """Get system HWID asynchronously"""
+        """Get system HWID, computed off the event loop and cached"""
+        if self._hwid is not None:
+            return self._hwid
+
         try:
-            # Get multiple system identifiers for a more unique HWID
-            system_info = {
-                'node': platform.node(),
-                'machine': platform.machine(),
-                'processor': platform.processor(),
-                'system': platform.system(),
-                'version': platform.version()
-            }
-            
-            # Create a unique hash from system information
-            hwid_string = json.dumps(system_info, sort_keys=True)
-            hasher = hashes.Hash(hashes.SHA256())
-            hasher.update(hwid_string.encode())
-            return base64.b64encode(hasher.finalize()).decode()
-            
+            self._hwid = await asyncio.to_thread(compute_hwid)
+            return self._hwid
         except Exception as e:
             logger.error(f"Failed to get HWID: {e}")
             return None
 
     async def verify_hwid(self, hwid: str) -> bool:
-        """Verify HWID with improved error handling and retry mechanism"""
+        """Verify HWID with jittered exponential-backoff retries"""
         console.print(f"\n[cyan]Verifying HWID: {hwid}[/]")
-        
-        if not self.session:
-            self.session = aiohttp.ClientSession()
 
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                # Add timestamp to headers
-                headers = {
-                    'Content-Type': 'application/json',
-                    'X-Timestamp': str(int(time.time())),
-                    'User-Agent': f'HWIDClient/{platform.system()}'
-                }
-
-                async with self.session.post(
-                    self.API_URL,
-                    json={'hwid': hwid},
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    data = await response.json()
-                    
-                    if response.status == 200:
-                        if data.get('exists') and data.get('verified') and data.get('status') == 'active':
-                            console.print("[green]✓ HWID verified successfully.[/]")
-                            return True
+        # Serialize the body once; retries reuse the same bytes
+        if orjson is not None:
+            body = orjson.dumps({'hwid': hwid})
+        else:
+            body = json.dumps({'hwid': hwid}).encode()
+
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(self.MAX_RETRIES),
+                wait=wait_exponential_jitter(initial=self.RETRY_DELAY, max=10),
+                retry=retry_if_exception_type(aiohttp.ClientError),
+                reraise=True
+            ):
+                with attempt:
+                    attempt_number = attempt.retry_state.attempt_number
+                    if attempt_number > 1:
+                        console.print(
+                            f"[yellow]Connection error, retrying... "
+                            f"({attempt_number}/{self.MAX_RETRIES})[/]"
+                        )
+
+                    async with self.session.post(
+                        self.API_URL,
+                        data=body,
+                        headers={'X-Timestamp': str(int(time.time()))}
+                    ) as response:
+                        data = await response.json()
+
+                        if response.status == 200:
+                            if data.get('exists') and data.get('verified') and data.get('status') == 'active':
+                                console.print("[green]✓ HWID verified successfully.[/]")
+                                return True
+                            else:
+                                if not data.get('verified'):
+                                    console.print("[yellow]⚠ HWID is not verified yet.[/]")
+                                elif data.get('status') != 'active':
+                                    console.print(f"[yellow]⚠ HWID status is: {data.get('status')}[/]")
+                                return False
                         else:
-                            if not data.get('verified'):
-                                console.print("[yellow]⚠ HWID is not verified yet.[/]")
-                            elif data.get('status') != 'active':
-                                console.print(f"[yellow]⚠ HWID status is: {data.get('status')}[/]")
+                            error_msg = data.get('error', 'Unknown error')
+                            console.print(f"[red]✗ HWID verification failed: {error_msg}[/]")
                             return False
-                    else:
-                        error_msg = data.get('error', 'Unknown error')
-                        console.print(f"[red]✗ HWID verification failed: {error_msg}[/]")
-                        return False
-                        
-            except aiohttp.ClientError as e:
-                if attempt < self.MAX_RETRIES - 1:
-                    console.print(f"[yellow]Connection error, retrying... ({attempt + 1}/{self.MAX_RETRIES})[/]")
-                    await asyncio.sleep(self.RETRY_DELAY)
-                    continue
-                console.print(f"[red]✗ Connection error: {e}[/]")
-                return False
-            except Exception as e:
-                if attempt < self.MAX_RETRIES - 1:
-                    console.print(f"[yellow]Error occurred, retrying... ({attempt + 1}/{self.MAX_RETRIES})[/]")
-                    await asyncio.sleep(self.RETRY_DELAY)
-                    continue
-                console.print(f"[red]✗ Error during verification: {e}[/]")
-                return False
-        
+
+        except aiohttp.ClientError as e:
+            console.print(f"[red]✗ Connection error: {e}[/]")
+            return False
+        except Exception as e:
+            console.print(f"[red]✗ Error during verification: {e}[/]")
+            return False
+        finally:
+            # Verification is the only HTTP call; release the connector and
+            # its sockets now instead of holding them until program exit
+            await self.session.close()
+            self.session = None
+            self._connector = None
+
         return False
 
+    async def _run_git(self, *args: str) -> int:
+        """Run a git command without a shell and return its exit code"""
+        proc = await asyncio.create_subprocess_exec("git", *args)
+        return await proc.wait()
+
     async def start_commits(self) -> None:
         """Start the commit process with progress tracking"""
-        if not Path(".git").exists():
-            os.system("git init")
-            os.system(f'git config user.name "{self.settings.author_name}"')
-            os.system(f'git config user.email "{self.settings.author_email}"')
+        # Open (or create) the repository once and build commits in-process
+        # instead of spawning a git subprocess per commit
+        repo = pygit2.init_repository(".", bare=False)
 
         console.print("\n[cyan]Starting commits process...[/]")
         
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                console=console
-            ) as progress:
-                
-                total_commits = self.settings.total_day * (
-                    self.settings.commit_freq if not self.settings.variability 
-                    else self.settings.commit_freq // 2
+            now = datetime.now()
+            template = self.settings.commit_message_template
+
+            # Precompute each day's date string, noon timestamp, and commit
+            # count up front so the workers and the commit pass agree exactly
+            day_dates = []
+            daily_counts = []
+            for d in range(self.settings.total_day):
+                commit_date = (now - timedelta(days=d)).replace(
+                    hour=12, minute=0, second=0
                 )
-                
-                task = progress.add_task("[cyan]Creating commits...", total=total_commits)
-                
-                async with aiofiles.open("commit.txt", "w") as f:
-                    pointer = 0
+                day_dates.append(
+                    (commit_date.strftime("%Y-%m-%d"), int(commit_date.timestamp()))
+                )
+                daily_counts.append(
+                    randint(0, self.settings.commit_freq + 1)
+                    if self.settings.variability else self.settings.commit_freq
+                )
+            total_commits = sum(daily_counts)
+
+            # Tree and blob objects have no ordering dependency, so shard
+            # their creation across a process pool; only the commit chain
+            # itself (parent linkage) must be built sequentially
+            day_jobs = []
+            ctr = 1
+            for day in range(self.settings.total_day):
+                day_jobs.append((ctr, daily_counts[day], day_dates[day][0]))
+                ctr += daily_counts[day]
+
+            workers = os.cpu_count() or 1
+            chunk = max(1, -(-len(day_jobs) // workers))
+            shards = [day_jobs[i:i + chunk] for i in range(0, len(day_jobs), chunk)]
+
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                tree_raw = b"".join(
+                    pool.map(_build_day_trees, repeat(repo.path), shards)
+                )
+
+            # tqdm's update path is far cheaper than Rich's live renderer
+            with tqdm(
+                total=total_commits,
+                desc="Creating commits",
+                unit="commit",
+                smoothing=0
+            ) as bar:
+                # Lines are coalesced per day and written straight through a
+                # pre-opened FD, skipping Python's buffered-I/O layer
+                fd = os.open("commit.txt", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
                     ctr = 1
-                    now = datetime.now()
+                    idx = 0
+                    parents = [] if repo.head_is_unborn else [repo.head.target]
+                    buf: list[str] = []
 
                     for day in range(self.settings.total_day):
-                        daily_commits = self.settings.commit_freq
-                        if self.settings.variability:
-                            daily_commits = randint(0, self.settings.commit_freq + 1)
+                        daily_commits = daily_counts[day]
+                        formatted_date, commit_ts = day_dates[day]
+                        signature = pygit2.Signature(
+                            self.settings.author_name,
+                            self.settings.author_email,
+                            commit_ts,
+                            0
+                        )
 
                         for _ in range(daily_commits):
-                            commit_date = now - timedelta(days=pointer)
-                            formatted_date = commit_date.strftime("%Y-%m-%d")
-                            await f.write(f"commit #{ctr}: {formatted_date}\n")
-                            
-                            commit_msg = self.settings.commit_message_template.format(ctr)
-                            os.system("git add .")
-                            os.system(f'git commit --date="{formatted_date} 12:00:00" -m "{commit_msg}"')
-                            
-                            progress.update(task, advance=1)
+                            buf.append(f"commit #{ctr}: {formatted_date}\n")
+
+                            tree_id = pygit2.Oid(raw=tree_raw[idx * 20:idx * 20 + 20])
+                            commit_id = repo.create_commit(
+                                "HEAD", signature, signature,
+                                template.format(ctr), tree_id, parents
+                            )
+                            parents = [commit_id]
                             ctr += 1
+                            idx += 1
 
-                        pointer += 1
+                        bar.update(daily_commits)
+                        if buf:
+                            os.write(fd, "".join(buf).encode())
+                            buf.clear()
+                finally:
+                    os.close(fd)
 
                 console.print("\n[green]Commits completed. Pushing to repository...[/]")
-                os.system(f"git remote add origin {self.settings.repo_link}")
-                os.system("git branch -M main")
-                os.system("git push -u origin main -f")
+                await self._run_git("remote", "add", "origin", self.settings.repo_link)
+                await self._run_git("branch", "-M", "main")
+                await self._run_git("push", "-u", "origin", "main", "-f")
                 console.print("\n[green]✓ Commits process completed and pushed to repository.[/]")
                 
         except Exception as e:
@@ -324,7 +457,7 @@ class HWIDClient:
         settings_table.add_column("Setting", style="cyan")
         settings_table.add_column("Value", style="green")
         
-        for field, value in asdict(self.settings).items():
+        for field, value in self._settings_dict().items():
             settings_table.add_row(
                 field.replace('_', ' ').title(),
                 str(value)
@@ -359,6 +492,8 @@ class HWIDClient:
     async def run(self) -> None:
         """Main program loop with improved error handling"""
         try:
+            await self.start()
+
             hwid = await self.get_hwid()
             if not hwid:
                 return
@@ -0,0 +1,49 @@
+# cython: language_level=3
+"""HWID computation helpers.
+
+Kept as a standalone module with plain typed functions so it can be
+AOT-compiled with mypyc (``mypyc hwid_util.py``) or Cython's pure-Python
+mode; it remains importable as ordinary Python either way.
+"""
+import hashlib
+import json
+import platform
+from typing import Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pybase64 as base64  # SIMD base64, drop-in stdlib API
+except ImportError:
+    import base64
+
+_system_info_cache: Optional[Dict[str, str]] = None
+
+
+def system_info() -> Dict[str, str]:
+    """Collect immutable system identifiers with a single uname call"""
+    global _system_info_cache
+    if _system_info_cache is None:
+        uname = platform.uname()
+        _system_info_cache = {
+            'node': uname.node,
+            'machine': uname.machine,
+            'processor': uname.processor,
+            'system': uname.system,
+            'version': uname.version
+        }
+    return _system_info_cache
+
+
+def compute_hwid() -> str:
+    """Create a unique hash from multiple system identifiers"""
+    info = system_info()
+    if orjson is not None:
+        hwid_bytes = orjson.dumps(info, option=orjson.OPT_SORT_KEYS)
+    else:
+        hwid_bytes = json.dumps(info, sort_keys=True).encode()
+    digest = hashlib.sha256(hwid_bytes).digest()
+    return base64.b64encode(digest).decode()